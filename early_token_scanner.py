@@ -7,17 +7,23 @@ Real-time alerts via WebSocket + API polling
 
 import asyncio
 import aiohttp
+import base64
 import logging
-import json
 import re
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass
+import struct
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+import orjson
 import os
+from email.utils import parsedate_to_datetime
 import websockets
+from solders.pubkey import Pubkey
 
 from telegram import Bot
 from telegram.error import TelegramError
+from telegram.request import HTTPXRequest
 
 logging.basicConfig(
     level=logging.INFO,
@@ -25,8 +31,82 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+ALERT_SEPARATOR = "\n\n──────────\n\n"
 
-@dataclass
+# str.translate table that deletes ASCII digits (counts digits in one C pass)
+ASCII_DIGIT_DELETE = str.maketrans('', '', '0123456789')
+
+WSOL_MINT = "So11111111111111111111111111111111111111112"
+
+# Trade links for an alert, filled with .format(addr=<mint>)
+_AXIOM_LINK = f"<a href='https://www.axiomtrade.app/swap?inputMint={WSOL_MINT}&outputMint={{addr}}'>Axiom</a>"
+_BIRDEYE_LINK = "<a href='https://birdeye.so/token/{addr}?chain=solana'>Birdeye</a>"
+TRADE_LINKS_TEMPLATE = f"\n📊 <b>TRADE:</b>\n{_AXIOM_LINK} | {_BIRDEYE_LINK}"
+PUMPFUN_TRADE_LINKS_TEMPLATE = (
+    f"\n📊 <b>TRADE:</b>\n{_AXIOM_LINK} | <a href='https://pump.fun/{{addr}}'>Pump.fun</a> | {_BIRDEYE_LINK}"
+)
+
+SOURCE_EMOJI = {
+    'pumpfun': '🎪',
+    'raydium': '🌊',
+    'orca': '🐋',
+    'jupiter': '🪐',
+    'birdeye': '🦅',
+}
+
+# DexScreener dexId -> scanner source; ids like 'raydium-clmm' match by substring
+DEX_SOURCES = {
+    'raydium': 'raydium',
+    'orca': 'orca',
+    'jupiter': 'jupiter',
+}
+
+# Shared read-only default for missing or null nested API objects
+_EMPTY: Dict = {}
+
+# Developer reputation display, keyed by DeveloperReputationTracker.check_developer()
+DEV_EMOJI = {
+    'elite': '👑',
+    'good': '✅',
+    'unknown': '❓',
+    'bad': '⚠️',
+}
+DEV_LABEL = {
+    'elite': 'ELITE DEVELOPER',
+    'good': 'Good Dev',
+    'unknown': 'Unknown Dev',
+    'bad': 'Risky Dev',
+}
+
+# Themes worth the higher priority bonus
+PREMIUM_THEMES = frozenset({'dogs', 'memes', 'ai', 'political'})
+
+# Alert tiers as (emoji, label), indexed by how many thresholds the priority clears
+PRIORITY_TIER_THRESHOLDS = (170, 180)
+PRIORITY_TIERS = (
+    ("🔥🔥", "QUALITY"),
+    ("🔥🔥🔥", "HOT"),
+    ("🚨💎🚨", "PREMIUM"),
+)
+
+
+def parse_retry_after(headers) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)"""
+    value = headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(slots=True)
 class EarlyToken:
     """Data class for early stage token"""
     address: str
@@ -35,7 +115,7 @@ class EarlyToken:
     source: str  # pumpfun, usd1, bonk, bags, raydium, jupiter
     initial_liquidity: float
     creator: str
-    timestamp: datetime
+    timestamp: float  # Creation time, epoch seconds
     bonding_curve: Optional[str] = None
     telegram: Optional[str] = None
     twitter: Optional[str] = None
@@ -46,80 +126,323 @@ class EarlyToken:
     holder_count: int = 0
     pool_id: Optional[str] = None
     creator_reputation: Optional[str] = None  # 'elite', 'good', 'unknown', 'bad'
+    # Lowercased once at parse time for keyword matching
+    name_lower: str = field(init=False, repr=False)
+    symbol_lower: str = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self.name_lower = self.name.lower()
+        self.symbol_lower = self.symbol.lower()
 
 
-class PumpFunWebSocketMonitor:
-    """Real-time WebSocket monitor for Pump.fun launches"""
+@dataclass(slots=True)
+class FilterResult:
+    """Outcome of meets_criteria, with the values calculate_priority reuses"""
+    passes: bool
+    reason: str
+    liquidity_usd: float = 0
+    sym_len: int = 0
+    theme_score: int = 0                  # Summed bonus of every matched theme
+
+
+class SeenCache:
+    """Bounded LRU of seen addresses whose entries expire individually"""
+    
+    def __init__(self, maxsize: int = 5000, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # {address: added_at}
+        
+    def __contains__(self, key: str) -> bool:
+        added_at = self._entries.get(key)
+        if added_at is None:
+            return False
+        if time.monotonic() - added_at > self.ttl:
+            del self._entries[key]
+            return False
+        return True
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def add(self, key: str):
+        """Mark key as seen, evicting expired and least recently added entries"""
+        now = time.monotonic()
+        self._entries[key] = now
+        self._entries.move_to_end(key)
+        
+        # Oldest entries sit at the front, so stop at the first live one
+        while self._entries:
+            oldest_key, oldest_at = next(iter(self._entries.items()))
+            if len(self._entries) <= self.maxsize and now - oldest_at <= self.ttl:
+                break
+            del self._entries[oldest_key]
+
+
+class ConditionalGet:
+    """Remembers ETag/Last-Modified validators so unchanged listings return 304"""
+    
+    def __init__(self):
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        
+    def headers(self) -> Dict[str, str]:
+        """Request headers for the next poll"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+    
+    def update(self, response_headers):
+        """Store validators from a 200 response"""
+        self.etag = response_headers.get('ETag')
+        self.last_modified = response_headers.get('Last-Modified')
+
+
+class RateLimitTracker:
+    """Pauses requests when x-ratelimit-* headers say the budget is almost spent"""
+    
+    def __init__(self, threshold: float = 0.1, max_delay: float = 120):
+        self.threshold = threshold            # Pause below this fraction of the limit
+        self.max_delay = max_delay            # Never pause longer than this, whatever the header says
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: float = 0              # Epoch seconds
+        
+    def record(self, headers):
+        """Update budget from response headers (absent headers are ignored)"""
+        try:
+            if 'x-ratelimit-limit' in headers:
+                self.limit = int(headers['x-ratelimit-limit'])
+            if 'x-ratelimit-remaining' in headers:
+                self.remaining = int(headers['x-ratelimit-remaining'])
+            if 'x-ratelimit-reset' in headers:
+                reset = float(headers['x-ratelimit-reset'])
+                # Providers send an epoch timestamp (seconds or milliseconds) or seconds until reset
+                if reset > 1e12:
+                    reset /= 1000
+                self.reset_at = reset if reset > 1e9 else time.time() + reset
+        except ValueError:
+            pass
+    
+    async def wait_if_throttled(self):
+        """Sleep until the window resets if the remaining budget is too low"""
+        if self.remaining is None:
+            return
+        floor = self.limit * self.threshold if self.limit else 1
+        if self.remaining < floor:
+            delay = min(self.reset_at - time.time(), self.max_delay)
+            if delay > 0:
+                logger.info("Rate limit nearly spent, pausing %.0fs", delay)
+                await asyncio.sleep(delay)
+            self.remaining = None
+
+
+class WebSocketMonitor:
+    """Shared connect/subscribe/reconnect loop for the streaming monitors"""
+    
+    name = "WebSocket"                        # Used in log messages
     
-    def __init__(self, callback):
-        self.ws_url = "wss://pumpportal.fun/api/data"
+    def __init__(self, callback, ws_url: str):
+        self.ws_url = ws_url
         self.callback = callback
-        self.reconnect_delay = 5
-        self.max_reconnect_delay = 60
+        self.reconnect_delay = 5              # Pause after a connection ends
+        self.fatal_retry_delay = 60           # Only used when websockets stops retrying
         
+    def subscribe_message(self) -> Dict:
+        """Request sent after every (re)connect"""
+        raise NotImplementedError
+    
+    def wants_frame(self, message) -> bool:
+        """Cheap raw-frame check run before JSON decoding"""
+        return True
+    
+    async def handle_message(self, data: Dict):
+        """Process one decoded frame"""
+        raise NotImplementedError
+    
     async def connect_and_subscribe(self):
-        """Connect to WebSocket and subscribe to new token events"""
-        current_delay = self.reconnect_delay
-        
+        """Connect, subscribe and dispatch frames, reconnecting forever"""
         while True:
             try:
-                logger.info(f"Connecting to Pump.fun WebSocket...")
+                logger.info(f"Connecting to {self.name}...")
                 
-                async with websockets.connect(
+                # Iterating connect() reconnects with websockets' own jittered backoff
+                async for websocket in websockets.connect(
                     self.ws_url,
                     ping_interval=20,
-                    ping_timeout=10
-                ) as websocket:
-                    logger.info("✅ Pump.fun WebSocket connected!")
-                    
-                    subscribe_message = {"method": "subscribeNewToken"}
-                    await websocket.send(json.dumps(subscribe_message))
-                    
-                    current_delay = self.reconnect_delay
-                    
-                    async for message in websocket:
-                        try:
-                            data = json.loads(message)
-                            await self.handle_message(data)
-                        except Exception as e:
-                            logger.error(f"Error handling Pump.fun message: {e}")
-                            
+                    ping_timeout=10,
+                    compression=None,             # Small JSON frames: skip per-frame inflate
+                    max_size=2**20,
+                    max_queue=64
+                ):
+                    try:
+                        await websocket.send(orjson.dumps(self.subscribe_message()).decode())  # Text frame
+                        logger.info(f"✅ {self.name} connected!")
+                        
+                        async for message in websocket:
+                            if not self.wants_frame(message):
+                                continue
+                            try:
+                                data = orjson.loads(message)
+                            except orjson.JSONDecodeError as e:
+                                logger.error("Malformed %s frame: %s", self.name, e)
+                                continue
+                            # One bad frame must not drop the connection
+                            try:
+                                await self.handle_message(data)
+                            except Exception as e:
+                                logger.error("Error handling %s message: %s", self.name, e)
+                                
+                    except websockets.ConnectionClosed as e:
+                        logger.warning(f"{self.name} closed ({e}), reconnecting...")
+                        
+                    # A clean close ends the message loop without an error, and
+                    # connect() only backs off on failed handshakes
+                    await asyncio.sleep(self.reconnect_delay)
+                        
             except Exception as e:
-                logger.error(f"Pump.fun WebSocket error: {e}")
-            
-            await asyncio.sleep(current_delay)
-            current_delay = min(current_delay * 2, self.max_reconnect_delay)
+                # Handshake errors websockets treats as permanent (bad URL, 4xx)
+                logger.error(f"{self.name} error: {e}")
+                await asyncio.sleep(self.fatal_retry_delay)
+
+
+class PumpFunWebSocketMonitor(WebSocketMonitor):
+    """Real-time WebSocket monitor for Pump.fun launches"""
+    
+    name = "Pump.fun WebSocket"
+    
+    def __init__(self, callback, ws_url: str = "wss://pumpportal.fun/api/data"):
+        super().__init__(callback, ws_url)
+        
+    def subscribe_message(self) -> Dict:
+        """Subscribe to new token events"""
+        return {"method": "subscribeNewToken"}
+    
+    def wants_frame(self, message) -> bool:
+        """Only creation frames can pass handle_message; skip the rest unparsed"""
+        return (b'"create"' if isinstance(message, bytes) else '"create"') in message
     
     async def handle_message(self, data: Dict):
         """Process incoming WebSocket message"""
+        if not isinstance(data, dict):
+            return
+        # Only creation events become tokens; trades and migrations are dropped here
+        if data.get('txType') != 'create':
+            return
         try:
-            if isinstance(data, dict):
-                if data.get('txType') == 'create' or 'mint' in data:
-                    token = self.parse_token_data(data)
-                    if token:
-                        await self.callback(token)
-        except Exception as e:
-            logger.error(f"Error in Pump.fun handle_message: {e}")
+            token = self.parse_token_data(data)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.error("Error parsing Pump.fun token: %s", e)
+            return
+        if token:
+            await self.callback(token)
     
     def parse_token_data(self, data: Dict) -> Optional[EarlyToken]:
         """Parse token data from WebSocket message"""
+        mint = data.get('mint')
+        if not mint:
+            return None
+        timestamp = data.get('timestamp')
+        return EarlyToken(
+            address=mint,
+            name=data.get('name') or 'Unknown',
+            symbol=data.get('symbol') or 'UNKNOWN',
+            source='pumpfun',
+            initial_liquidity=float(data.get('initialBuy', 0) or data.get('vSolInBondingCurve', 0)),
+            creator=data.get('traderPublicKey', ''),
+            timestamp=timestamp / 1000 if timestamp else time.time(),
+            bonding_curve=data.get('bondingCurveKey'),
+            market_cap=float(data.get('marketCapSol', 0)),
+            twitter=data.get('twitter'),
+            telegram=data.get('telegram'),
+            website=data.get('website'),
+        )
+
+
+class PumpFunLogsMonitor(WebSocketMonitor):
+    """Real-time Solana RPC logsSubscribe monitor for the Pump.fun program"""
+    
+    name = "Solana RPC WebSocket"
+    PROGRAM_ID = "6EF8rrecthR5Dkzon8Nwu78hRvfCKubJ14M5uBEwF6P"
+    # Anchor event discriminator: sha256("event:CreateEvent")[:8]
+    CREATE_EVENT_DISCRIMINATOR = bytes.fromhex("1b72a94ddeeb6376")
+    
+    def subscribe_message(self) -> Dict:
+        """Subscribe to Pump.fun program logs"""
+        return {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "logsSubscribe",
+            "params": [
+                {"mentions": [self.PROGRAM_ID]},
+                {"commitment": "processed"}
+            ]
+        }
+            
+    async def handle_message(self, data: Dict):
+        """Process incoming logsNotification"""
+        if not isinstance(data, dict) or data.get('method') != 'logsNotification':
+            return
+            
+        value = data.get('params', {}).get('result', {}).get('value', {})
+        if value.get('err') is not None:
+            return
+            
+        for log in value.get('logs', []):
+            if log.startswith('Program data: '):
+                token = self.parse_create_event(log[len('Program data: '):])
+                if token:
+                    await self.callback(token)
+                    
+    def parse_create_event(self, payload: str) -> Optional[EarlyToken]:
+        """Decode a borsh-encoded CreateEvent emitted by the Pump.fun program"""
         try:
+            raw = base64.b64decode(payload)
+        except ValueError:
+            return None
+            
+        if not raw.startswith(self.CREATE_EVENT_DISCRIMINATOR):
+            return None
+            
+        try:
+            offset = len(self.CREATE_EVENT_DISCRIMINATOR)
+            strings = []
+            for _ in range(3):  # name, symbol, uri
+                (length,) = struct.unpack_from('<I', raw, offset)
+                offset += 4
+                strings.append(raw[offset:offset + length].decode('utf-8', 'replace'))
+                offset += length
+            name, symbol, _uri = strings
+            
+            mint = Pubkey.from_bytes(raw[offset:offset + 32])
+            bonding_curve = Pubkey.from_bytes(raw[offset + 32:offset + 64])
+            user = Pubkey.from_bytes(raw[offset + 64:offset + 96])
+            offset += 96
+            
+            # Newer program versions append creator, timestamp and reserves
+            timestamp = time.time()
+            virtual_sol = 0.0
+            if len(raw) >= offset + 56:
+                (created_at,) = struct.unpack_from('<q', raw, offset + 32)
+                (virtual_sol_lamports,) = struct.unpack_from('<Q', raw, offset + 48)
+                timestamp = float(created_at)
+                virtual_sol = virtual_sol_lamports / 1e9
+                
             return EarlyToken(
-                address=data.get('mint', ''),
-                name=data.get('name', 'Unknown'),
-                symbol=data.get('symbol', 'UNKNOWN'),
+                address=str(mint),
+                name=name or 'Unknown',
+                symbol=symbol or 'UNKNOWN',
                 source='pumpfun',
-                initial_liquidity=float(data.get('initialBuy', 0) or data.get('vSolInBondingCurve', 0)),
-                creator=data.get('traderPublicKey', ''),
-                timestamp=datetime.fromtimestamp(data.get('timestamp', 0) / 1000) if data.get('timestamp') else datetime.now(),
-                bonding_curve=data.get('bondingCurveKey'),
-                market_cap=float(data.get('marketCapSol', 0)),
-                twitter=data.get('twitter'),
-                telegram=data.get('telegram'),
-                website=data.get('website'),
+                initial_liquidity=virtual_sol,
+                creator=str(user),
+                timestamp=timestamp,
+                bonding_curve=str(bonding_curve),
             )
         except Exception as e:
-            logger.error(f"Error parsing Pump.fun token: {e}")
+            logger.error("Error parsing Pump.fun CreateEvent: %s", e)
             return None
 
 
@@ -129,61 +452,85 @@ class DexScreenerMonitor:
     def __init__(self, callback, session):
         self.callback = callback
         self.session = session
-        self.seen_pairs = set()
+        self.seen_pairs = SeenCache(maxsize=2000, ttl=3600)
         self.api_url = "https://api.dexscreener.com/latest/dex/tokens"
+        self.conditional = ConditionalGet()
+        self.retry_after: Optional[float] = None
+        self.rate_limit = RateLimitTracker()
+        self.latency: Optional[float] = None  # Seconds the last GET took, excluding throttle pauses
         
-    async def scan_new_pairs(self):
-        """Scan for new pairs across all DEXs"""
+    async def scan_new_pairs(self) -> Optional[int]:
+        """Scan for new pairs across all DEXs, returning the HTTP status"""
         try:
             # Get recently created pairs on Solana
             url = "https://api.dexscreener.com/latest/dex/search/?q=solana"
             
-            async with self.session.get(url) as response:
+            self.latency = None
+            await self.rate_limit.wait_if_throttled()
+            started = time.monotonic()
+            async with self.session.get(url, headers=self.conditional.headers()) as response:
+                self.latency = time.monotonic() - started
+                self.rate_limit.record(response.headers)
+                self.retry_after = parse_retry_after(response.headers) if response.status == 429 else None
+                
+                if response.status == 304:
+                    return response.status  # Listing unchanged since last scan
+                
                 if response.status == 200:
-                    data = await response.json()
-                    pairs = data.get('pairs', [])
+                    body = await response.read()
+                    self.latency = time.monotonic() - started
+                    data = orjson.loads(body)
+                    # Search results aren't ordered by age: sort newest first once
+                    pairs = sorted(
+                        data.get('pairs') or [],
+                        key=lambda pair: pair.get('pairCreatedAt') or 0,
+                        reverse=True,
+                    )
+                    now = time.time()  # Shared fallback timestamp for this page
                     
+                    # No creation-time cutoff: a pair can first appear after newer ones; seen_pairs dedups
                     for pair in pairs[:50]:  # Top 50 recent
                         pair_id = pair.get('pairAddress')
                         if pair_id and pair_id not in self.seen_pairs:
-                            token = self.parse_pair_data(pair)
+                            token = self.parse_pair_data(pair, now)
                             if token:
                                 self.seen_pairs.add(pair_id)
                                 await self.callback(token)
                                 
+                    # Only cache validators once the page has been fully processed
+                    self.conditional.update(response.headers)
+                    
+                return response.status
+                
         except Exception as e:
-            logger.error(f"DexScreener scan error: {e}")
+            logger.error("DexScreener scan error: %s", e)
+            return None
     
-    def parse_pair_data(self, pair: Dict) -> Optional[EarlyToken]:
-        """Parse pair data to token"""
+    def parse_pair_data(self, pair: Dict, now: float) -> Optional[EarlyToken]:
+        """Parse pair data to token, using now when the pair has no creation time"""
         try:
-            base_token = pair.get('baseToken', {})
+            base_token = pair.get('baseToken') or _EMPTY
             
             # Determine source from DEX name
-            dex_id = pair.get('dexId', '').lower()
-            if 'raydium' in dex_id:
-                source = 'raydium'
-            elif 'orca' in dex_id:
-                source = 'orca'
-            elif 'jupiter' in dex_id:
-                source = 'jupiter'
-            else:
-                source = f'dex_{dex_id}'
+            dex_id = (pair.get('dexId') or '').lower()
+            source = DEX_SOURCES.get(dex_id)
+            if source is None:
+                source = next((name for key, name in DEX_SOURCES.items() if key in dex_id), f'dex_{dex_id}')
             
             return EarlyToken(
                 address=base_token.get('address', ''),
                 name=base_token.get('name', 'Unknown'),
                 symbol=base_token.get('symbol', 'UNKNOWN'),
                 source=source,
-                initial_liquidity=float(pair.get('liquidity', {}).get('usd', 0)),
+                initial_liquidity=float((pair.get('liquidity') or _EMPTY).get('usd', 0)),
                 creator='',
-                timestamp=datetime.fromtimestamp(pair.get('pairCreatedAt', 0) / 1000) if pair.get('pairCreatedAt') else datetime.now(),
+                timestamp=pair.get('pairCreatedAt', 0) / 1000 if pair.get('pairCreatedAt') else now,
                 market_cap=float(pair.get('fdv', 0) or 0),
-                volume=float(pair.get('volume', {}).get('h24', 0) or 0),
+                volume=float((pair.get('volume') or _EMPTY).get('h24', 0) or 0),
                 pool_id=pair.get('pairAddress'),
             )
         except Exception as e:
-            logger.error(f"Error parsing DexScreener pair: {e}")
+            logger.error("Error parsing DexScreener pair: %s", e)
             return None
 
 
@@ -195,12 +542,18 @@ class BirdeyeMonitor:
         self.session = session
         self.api_key = api_key
         self.base_url = "https://public-api.birdeye.so"
-        self.seen_tokens = set()
+        self.seen_tokens = SeenCache(maxsize=2000, ttl=3600)
+        self.last_creation_time = 0           # Newest creationTime already scanned
+        self.conditional = ConditionalGet()
+        self.retry_after: Optional[float] = None
+        self.rate_limit = RateLimitTracker()
+        self.latency: Optional[float] = None  # Seconds the last GET took, excluding throttle pauses
         
-    async def scan_new_tokens(self):
-        """Scan for newly created tokens"""
+    async def scan_new_tokens(self) -> Optional[int]:
+        """Scan for newly created tokens, returning the HTTP status"""
         try:
             headers = {'X-API-KEY': self.api_key} if self.api_key else {}
+            headers.update(self.conditional.headers())
             
             url = f"{self.base_url}/defi/token_creation"
             params = {
@@ -210,24 +563,51 @@ class BirdeyeMonitor:
                 'limit': 50
             }
             
+            self.latency = None
+            await self.rate_limit.wait_if_throttled()
+            started = time.monotonic()
             async with self.session.get(url, headers=headers, params=params) as response:
+                self.latency = time.monotonic() - started
+                self.rate_limit.record(response.headers)
+                self.retry_after = parse_retry_after(response.headers) if response.status == 429 else None
+                
+                if response.status == 304:
+                    return response.status  # No new tokens since last scan
+                
                 if response.status == 200:
-                    data = await response.json()
+                    body = await response.read()
+                    self.latency = time.monotonic() - started
+                    data = orjson.loads(body)
                     items = data.get('data', {}).get('items', [])
+                    newest = self.last_creation_time
+                    now = time.time()  # Shared fallback timestamp for this page
                     
                     for item in items:
+                        # Items are newest first: stop once we reach the previous scan
+                        created = item.get('creationTime') or 0
+                        if created and created < self.last_creation_time:
+                            break
+                        newest = max(newest, created)
+                        
                         token_address = item.get('address')
                         if token_address and token_address not in self.seen_tokens:
-                            token = self.parse_token_data(item)
+                            token = self.parse_token_data(item, now)
                             if token:
                                 self.seen_tokens.add(token_address)
                                 await self.callback(token)
                                 
+                    self.last_creation_time = newest
+                    # Only cache validators once the page has been fully processed
+                    self.conditional.update(response.headers)
+                    
+                return response.status
+                
         except Exception as e:
-            logger.error(f"Birdeye scan error: {e}")
+            logger.error("Birdeye scan error: %s", e)
+            return None
     
-    def parse_token_data(self, data: Dict) -> Optional[EarlyToken]:
-        """Parse Birdeye token data"""
+    def parse_token_data(self, data: Dict, now: float) -> Optional[EarlyToken]:
+        """Parse Birdeye token data, using now when the item has no creation time"""
         try:
             return EarlyToken(
                 address=data.get('address', ''),
@@ -236,11 +616,11 @@ class BirdeyeMonitor:
                 source='birdeye',
                 initial_liquidity=float(data.get('liquidity', 0)),
                 creator=data.get('creator', ''),
-                timestamp=datetime.fromtimestamp(data.get('creationTime', 0)) if data.get('creationTime') else datetime.now(),
+                timestamp=float(data.get('creationTime', 0)) if data.get('creationTime') else now,
                 market_cap=float(data.get('mc', 0)),
             )
         except Exception as e:
-            logger.error(f"Error parsing Birdeye token: {e}")
+            logger.error("Error parsing Birdeye token: %s", e)
             return None
 
 
@@ -312,19 +692,33 @@ class DeveloperReputationTracker:
 class MultiLaunchpadScanner:
     """Scanner for multiple Solana launchpads and DEXs"""
     
-    def __init__(self, telegram_token: str, chat_id: str):
+    def __init__(self, telegram_token: str, chat_id: str, rpc_ws_url: Optional[str] = None):
         self.telegram_token = telegram_token
         self.chat_id = chat_id
-        self.bot = Bot(token=telegram_token)
+        self.rpc_ws_url = rpc_ws_url
+        # Persistent keep-alive pool to api.telegram.org, reused by every alert
+        self.telegram_request = HTTPXRequest(
+            connection_pool_size=8,
+            connect_timeout=5.0,
+            read_timeout=10.0,
+            pool_timeout=5.0,                 # Wait for a free pooled connection during bursts
+        )
+        self.bot = Bot(token=telegram_token, request=self.telegram_request)
         self.session: Optional[aiohttp.ClientSession] = None
         
-        self.seen_tokens: Set[str] = set()
+        self.seen_tokens = SeenCache(maxsize=5000, ttl=3600)
+        
+        # Alerts are queued and sent in batches by alert_sender()
+        self.alert_queue: asyncio.Queue = asyncio.Queue(maxsize=256)
+        self.alert_batch_size = 5             # Flush after this many alerts...
+        self.alert_batch_window = 2.0         # ...or this many seconds after the first
         
         # Initialize developer tracker
         self.dev_tracker = DeveloperReputationTracker()
         
         # Initialize monitors (will be set in start())
         self.pumpfun_ws = None
+        self.pumpfun_logs = None
         self.dexscreener = None
         self.birdeye = None
         
@@ -387,31 +781,78 @@ class MultiLaunchpadScanner:
             'elite_dev_bonus': 50,            # Priority bonus for elite devs
             'good_dev_bonus': 25,             # Priority bonus for good devs
         }
+        
+        # Compile keyword lists once instead of looping over them per token
+        self.build_keyword_matchers()
+        
+        # SCAN CADENCE (AIMD: back off fast on 429/slow responses, recover slowly)
+        self.scan_interval = 30.0
+        self.min_scan_interval = 10.0
+        self.max_scan_interval = 120.0
+        self.scan_interval_step = 1.0         # Additive decrease per healthy cycle
+        self.scan_latency_target = 5.0        # Seconds before a cycle counts as slow
+    
+    @staticmethod
+    def compile_keywords(keywords) -> re.Pattern:
+        """Compile keywords into one alternation, longest first"""
+        keywords = sorted(set(keywords), key=len, reverse=True)
+        if not keywords:
+            return re.compile(r'(?!)')  # Never matches
+        return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+    
+    def build_keyword_matchers(self):
+        """Precompile blacklist, banned-pattern and theme matchers (call again after editing criteria)"""
+        themes = self.criteria.get('winning_themes', {})
+        self.blacklist_re = self.compile_keywords(self.criteria['blacklist_keywords'])
+        banned = self.criteria.get('banned_patterns', [])
+        self.banned_re = re.compile('|'.join(f'(?:{pattern})' for pattern in banned) if banned else r'(?!)')
+        self.any_theme_re = self.compile_keywords(kw for keywords in themes.values() for kw in keywords)
+        # (theme_name, score bonus, pattern); premium narratives score higher
+        self.theme_res = [
+            (theme_name, 35 if theme_name in PREMIUM_THEMES else 25, self.compile_keywords(keywords))
+            for theme_name, keywords in themes.items()
+        ]
     
     async def start(self):
         """Initialize scanner"""
         import ssl
+        # One pooled session shared by every HTTP monitor, kept warm across scans
+        connector_options = {
+            'limit': 100,
+            'limit_per_host': 20,
+            # Outlive the longest adaptive scan gap so idle sockets stay warm
+            'keepalive_timeout': self.max_scan_interval + 30,
+            'ttl_dns_cache': 300,
+            'enable_cleanup_closed': True,
+        }
         try:
-            self.session = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(**connector_options)
         except Exception as e:
             logger.warning(f"Using SSL bypass: {e}")
             ssl_context = ssl.create_default_context()
             ssl_context.check_hostname = False
             ssl_context.verify_mode = ssl.CERT_NONE
-            self.session = aiohttp.ClientSession(
-                connector=aiohttp.TCPConnector(ssl=ssl_context)
-            )
+            connector = aiohttp.TCPConnector(ssl=ssl_context, **connector_options)
+        
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=15, sock_connect=3)
+        )
         
         # Initialize monitors
         self.pumpfun_ws = PumpFunWebSocketMonitor(callback=self.on_new_token)
+        if self.rpc_ws_url:
+            self.pumpfun_logs = PumpFunLogsMonitor(callback=self.on_new_token, ws_url=self.rpc_ws_url)
         self.dexscreener = DexScreenerMonitor(callback=self.on_new_token, session=self.session)
         self.birdeye = BirdeyeMonitor(callback=self.on_new_token, session=self.session)
         
         logger.info("Multi-Launchpad Scanner started!")
+        logs_line = "• ⛓️ Pump.fun (Solana logsSubscribe)\n" if self.pumpfun_logs else ""
         await self.send_message(
             "🚀 <b>MULTI-LAUNCHPAD SCANNER v4.0</b> 🚀\n\n"
             "📡 Monitoring:\n"
             "• 🎪 Pump.fun (WebSocket)\n"
+            f"{logs_line}"
             "• 🌊 Raydium (DexScreener)\n"
             "• 🦅 Orca (DexScreener)\n"
             "• 🪐 Jupiter (DexScreener)\n"
@@ -428,6 +869,20 @@ class MultiLaunchpadScanner:
         """Clean up"""
         if self.session:
             await self.session.close()
+        await self.telegram_request.shutdown()
+    
+    async def __aenter__(self):
+        """Start scanner and own the shared session for the block"""
+        try:
+            await self.start()
+        except BaseException:
+            await self.stop()
+            raise
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close the shared session"""
+        await self.stop()
     
     async def send_message(self, message: str, disable_preview: bool = False):
         """Send to Telegram"""
@@ -439,7 +894,43 @@ class MultiLaunchpadScanner:
                 disable_web_page_preview=disable_preview
             )
         except TelegramError as e:
-            logger.error(f"Telegram error: {e}")
+            logger.error("Telegram error: %s", e)
+    
+    async def alert_sender(self):
+        """Drain the alert queue, coalescing bursts into as few messages as possible"""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await self.alert_queue.get()]
+            deadline = loop.time() + self.alert_batch_window
+            
+            while len(batch) < self.alert_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.alert_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            for message in self.pack_alerts(batch):
+                await self.send_message(message, disable_preview=True)
+    
+    @staticmethod
+    def pack_alerts(alerts: List[str]) -> List[str]:
+        """Join alerts into messages that fit Telegram's length limit"""
+        messages = []
+        current = ""
+        for alert in alerts:
+            candidate = f"{current}{ALERT_SEPARATOR}{alert}" if current else alert
+            if current and len(candidate) > TELEGRAM_MAX_MESSAGE_LENGTH:
+                messages.append(current)
+                current = alert
+            else:
+                current = candidate
+        if current:
+            messages.append(current)
+        return messages
     
     async def on_new_token(self, token: EarlyToken):
         """Callback for new tokens from any source"""
@@ -447,33 +938,36 @@ class MultiLaunchpadScanner:
             if token.address in self.seen_tokens:
                 return
             
+            # Age computed once and shared by the filter, scorer and formatter
+            age_seconds = time.time() - token.timestamp
+            
             # Check developer reputation
             if token.creator:
                 token.creator_reputation = self.dev_tracker.check_developer(token.creator)
                 
                 # Block bad developers
                 if self.criteria.get('block_bad_devs') and token.creator_reputation == 'bad':
-                    logger.warning(f"🚫 {token.symbol}: Known bad developer {token.creator[:8]}...")
+                    logger.warning("🚫 %s: Known bad developer %s...", token.symbol, token.creator[:8])
                     return
             
             # Source filter
             allowed = self.criteria.get('allowed_sources', [])
             if allowed and token.source not in allowed:
-                logger.debug(f"❌ {token.symbol}: Source {token.source} not allowed")
+                logger.debug("❌ %s: Source %s not allowed", token.symbol, token.source)
                 return
             
             # Criteria check
-            passes, reason = self.meets_criteria(token)
-            if not passes:
-                logger.debug(f"❌ {token.symbol}: {reason}")
+            result = self.meets_criteria(token, age_seconds)
+            if not result.passes:
+                logger.debug("❌ %s: %s", token.symbol, result.reason)
                 return
             
             # Priority check
-            priority = self.calculate_priority(token)
+            priority = self.calculate_priority(token, age_seconds, result)
             min_priority = self.criteria.get('min_priority_score', 0)
             
             if priority < min_priority:
-                logger.info(f"⚠️ {token.symbol}: Low priority ({priority}/{min_priority})")
+                logger.info("⚠️ %s: Low priority (%s/%s)", token.symbol, priority, min_priority)
                 return
             
             # Log with dev reputation
@@ -483,24 +977,26 @@ class MultiLaunchpadScanner:
             elif token.creator_reputation == 'good':
                 dev_indicator = " [GOOD DEV ✅]"
                 
-            logger.info(f"🔥 {token.source.upper()}: {token.symbol}{dev_indicator} (Priority: {priority}/200)")
+            logger.info("🔥 %s: %s%s (Priority: %s/200)", token.source.upper(), token.symbol, dev_indicator, priority)
             
-            # Send alert
-            message = self.format_alert(token, priority)
-            await self.send_message(message, disable_preview=True)
+            # Queue alert for the batched sender
+            message = self.format_alert(token, priority, age_seconds)
+            try:
+                self.alert_queue.put_nowait(message)
+            except asyncio.QueueFull:
+                logger.warning("Alert queue full, dropping alert for %s", token.symbol)
             
             self.seen_tokens.add(token.address)
             
         except Exception as e:
-            logger.error(f"Error in on_new_token: {e}")
+            logger.error("Error in on_new_token: %s", e)
     
-    def meets_criteria(self, token: EarlyToken) -> tuple[bool, str]:
+    def meets_criteria(self, token: EarlyToken, age_seconds: float) -> FilterResult:
         """Check if token meets criteria"""
         
         # Age check
-        age_seconds = (datetime.now() - token.timestamp).total_seconds()
         if age_seconds > self.criteria['max_token_age_seconds']:
-            return False, f"Too old ({age_seconds:.0f}s)"
+            return FilterResult(False, f"Too old ({age_seconds:.0f}s)")
         
         # Liquidity (convert from USD if needed, assume 1 SOL = ~$100 for rough estimate)
         liq = token.initial_liquidity
@@ -509,59 +1005,52 @@ class MultiLaunchpadScanner:
             liq = liq * 100  # Rough SOL to USD conversion
             
         if liq < self.criteria['min_liquidity']:
-            return False, f"Low liquidity (${liq:.0f})"
+            return FilterResult(False, f"Low liquidity (${liq:.0f})")
         if liq > self.criteria['max_liquidity'] * 1000:  # Max in thousands
-            return False, f"High liquidity (${liq:.0f})"
+            return FilterResult(False, f"High liquidity (${liq:.0f})")
         
         # Symbol length
         sym_len = len(token.symbol)
         if sym_len > self.criteria.get('max_symbol_length', 10):
-            return False, f"Symbol too long ({sym_len})"
+            return FilterResult(False, f"Symbol too long ({sym_len})")
         if sym_len < self.criteria.get('min_symbol_length', 2):
-            return False, f"Symbol too short ({sym_len})"
+            return FilterResult(False, f"Symbol too short ({sym_len})")
+        
+        # Quality name (cheap per-character check, kept ahead of the regex scans)
+        symbol = token.symbol
+        if symbol.isascii():
+            digit_count = sym_len - len(symbol.translate(ASCII_DIGIT_DELETE))
+        else:
+            digit_count = sum(c.isdigit() for c in symbol)  # Unicode digits too
+        if digit_count > 1:
+            return FilterResult(False, "Too many numbers")
         
-        # Blacklist
-        name_lower = token.name.lower()
-        symbol_lower = token.symbol.lower()
+        # Blacklist (name and symbol scanned in one pass; NUL never appears in a keyword)
+        text = f"{token.name_lower}\x00{token.symbol_lower}"
         
-        for keyword in self.criteria['blacklist_keywords']:
-            if keyword in name_lower or keyword in symbol_lower:
-                return False, f"Blacklisted: {keyword}"
+        blacklisted = self.blacklist_re.search(text)
+        if blacklisted:
+            return FilterResult(False, f"Blacklisted: {blacklisted.group()}")
         
         # Banned patterns
-        for pattern in self.criteria.get('banned_patterns', []):
-            if re.search(pattern, name_lower) or re.search(pattern, symbol_lower):
-                return False, f"Banned pattern"
+        if self.banned_re.search(token.name_lower) or self.banned_re.search(token.symbol_lower):
+            return FilterResult(False, "Banned pattern")
         
         # Theme requirement
         if self.criteria.get('require_theme_match'):
-            has_theme = False
-            themes = self.criteria.get('winning_themes', {})
-            
-            for theme_name, keywords in themes.items():
-                for keyword in keywords:
-                    if keyword in name_lower or keyword in symbol_lower:
-                        has_theme = True
-                        break
-                if has_theme:
-                    break
-            
-            if not has_theme:
-                return False, "No theme match"
+            if not self.any_theme_re.search(text):
+                return FilterResult(False, "No theme match")
         
-        # Quality name
-        digit_count = sum(c.isdigit() for c in token.symbol)
-        if digit_count > 1:
-            return False, "Too many numbers"
+        # Themes are resolved only for tokens that pass; calculate_priority adds the total
+        theme_score = sum(bonus for _, bonus, pattern in self.theme_res if pattern.search(text))
         
-        return True, "✅ Passed"
+        return FilterResult(True, "✅ Passed", liq, sym_len, theme_score)
     
-    def calculate_priority(self, token: EarlyToken) -> int:
-        """Calculate priority score"""
+    def calculate_priority(self, token: EarlyToken, age_seconds: float, result: FilterResult) -> int:
+        """Calculate priority score from a passing FilterResult"""
         score = 0
         
         # Timing (2-5 min sweet spot)
-        age_seconds = (datetime.now() - token.timestamp).total_seconds()
         if 120 <= age_seconds <= 300:
             score += 50
         elif 60 <= age_seconds <= 600:
@@ -572,10 +1061,7 @@ class MultiLaunchpadScanner:
             score += 20
         
         # Liquidity
-        liq = token.initial_liquidity
-        if token.source == 'pumpfun':
-            liq = liq * 100
-            
+        liq = result.liquidity_usd
         if 3000 <= liq <= 10000:
             score += 40
         elif 2000 <= liq <= 15000:
@@ -590,25 +1076,14 @@ class MultiLaunchpadScanner:
             score += 15
         
         # Symbol quality
-        sym_len = len(token.symbol)
+        sym_len = result.sym_len
         if 3 <= sym_len <= 5:
             score += 20
         elif sym_len <= 7:
             score += 15
         
         # Theme match
-        name_lower = token.name.lower()
-        symbol_lower = token.symbol.lower()
-        
-        themes = self.criteria.get('winning_themes', {})
-        for theme_name, keywords in themes.items():
-            for keyword in keywords:
-                if keyword in name_lower or keyword in symbol_lower:
-                    if theme_name in ['dogs', 'memes', 'ai', 'political']:
-                        score += 35
-                    else:
-                        score += 25
-                    break
+        score += result.theme_score
         
         # Clean name
         if token.symbol.isalpha():
@@ -622,41 +1097,27 @@ class MultiLaunchpadScanner:
         
         return min(score, 250)  # Increased max to accommodate dev bonus
     
-    def format_alert(self, token: EarlyToken, priority: int) -> str:
+    def format_alert(self, token: EarlyToken, priority: int, age_seconds: float) -> str:
         """Format alert message"""
-        age_seconds = (datetime.now() - token.timestamp).total_seconds()
-        
         # Source emoji
-        source_emoji = {
-            'pumpfun': '🎪',
-            'raydium': '🌊',
-            'orca': '🐋',
-            'jupiter': '🪐',
-            'birdeye': '🦅',
-        }.get(token.source, '📡')
+        source_emoji = SOURCE_EMOJI.get(token.source, '📡')
         
         # Priority emoji
-        if priority >= 180:
-            emoji = "🚨💎🚨"
-            label = "PREMIUM"
-        elif priority >= 170:
-            emoji = "🔥🔥🔥"
-            label = "HOT"
-        else:
-            emoji = "🔥🔥"
-            label = "QUALITY"
+        hot, premium = PRIORITY_TIER_THRESHOLDS
+        emoji, label = PRIORITY_TIERS[(priority >= hot) + (priority >= premium)]
         
         liq_display = token.initial_liquidity
         liq_unit = "SOL" if token.source == 'pumpfun' else "USD"
         
-        msg = (
+        # Collect fragments and join once at the end
+        parts = [
             f"{emoji} <b>{label} LAUNCH</b> {emoji}\n\n"
             f"<b>{token.symbol}</b> - {token.name}\n"
             f"{source_emoji} Source: <b>{token.source.upper()}</b>\n"
             f"📍 <code>{token.address}</code>\n\n"
             f"⏱️ Age: {int(age_seconds//60)}m {int(age_seconds%60)}s\n"
             f"💧 Liquidity: {liq_display:.1f} {liq_unit}\n"
-        )
+        ]
         
         # Add market cap if available
         if token.market_cap > 0:
@@ -666,28 +1127,15 @@ class MultiLaunchpadScanner:
                 mc_display = f"${token.market_cap/1000:.1f}K"
             else:
                 mc_display = f"${token.market_cap/1_000_000:.2f}M"
-            msg += f"💰 Market Cap: {mc_display}\n"
+            parts.append(f"💰 Market Cap: {mc_display}\n")
         
-        msg += f"⭐ Priority: {priority}/250\n"
+        parts.append(f"⭐ Priority: {priority}/250\n")
         
         # Developer reputation
-        if token.creator_reputation:
-            dev_emoji = {
-                'elite': '👑',
-                'good': '✅',
-                'unknown': '❓',
-                'bad': '⚠️'
-            }.get(token.creator_reputation, '')
-            
-            dev_label = {
-                'elite': 'ELITE DEVELOPER',
-                'good': 'Good Dev',
-                'unknown': 'Unknown Dev',
-                'bad': 'Risky Dev'
-            }.get(token.creator_reputation, '')
-            
-            if token.creator_reputation in ['elite', 'good']:
-                msg += f"{dev_emoji} <b>{dev_label}</b>\n"
+        if token.creator_reputation in ('elite', 'good'):
+            parts.append(
+                f"{DEV_EMOJI[token.creator_reputation]} <b>{DEV_LABEL[token.creator_reputation]}</b>\n"
+            )
         
         # Socials
         socials = []
@@ -699,61 +1147,75 @@ class MultiLaunchpadScanner:
             socials.append(f"<a href='{token.website}'>Web</a>")
         
         if socials:
-            msg += f"\n🔗 {' | '.join(socials)}\n"
+            parts.append(f"\n🔗 {' | '.join(socials)}\n")
         
         # Trade links
-        msg += (
-            f"\n📊 <b>TRADE:</b>\n"
-            f"<a href='https://www.axiomtrade.app/swap?inputMint=So11111111111111111111111111111111111111112&outputMint={token.address}'>Axiom</a> | "
-        )
-        
-        if token.source == 'pumpfun':
-            msg += f"<a href='https://pump.fun/{token.address}'>Pump.fun</a> | "
-        
-        msg += f"<a href='https://birdeye.so/token/{token.address}?chain=solana'>Birdeye</a>"
+        links = PUMPFUN_TRADE_LINKS_TEMPLATE if token.source == 'pumpfun' else TRADE_LINKS_TEMPLATE
+        parts.append(links.format(addr=token.address))
         
         if token.pool_id:
-            msg += f" | <a href='https://dexscreener.com/solana/{token.pool_id}'>DexScreener</a>"
+            parts.append(f" | <a href='https://dexscreener.com/solana/{token.pool_id}'>DexScreener</a>")
         
-        msg += f"\n\n⚡ Multi-source scan - {int(age_seconds//60)}m old"
+        parts.append(f"\n\n⚡ Multi-source scan - {int(age_seconds//60)}m old")
         
-        return msg
+        return "".join(parts)
+    
+    def adjust_scan_interval(self, statuses: List, latency: float):
+        """AIMD update of the polling interval from the last scan cycle"""
+        if 429 in statuses or latency > self.scan_latency_target:
+            self.scan_interval = min(self.max_scan_interval, self.scan_interval * 2)
+            logger.info("Scan interval backed off to %.0fs", self.scan_interval)
+        elif all(isinstance(status, int) and status < 500 for status in statuses):
+            # Other 4xx (e.g. Birdeye 401 without an API key) is a config issue, not load
+            self.scan_interval = max(self.min_scan_interval, self.scan_interval - self.scan_interval_step)
+        # Transport failures (None), exceptions and 5xx hold the interval
     
     async def run(self):
         """Main run loop"""
         # Start Pump.fun WebSocket
         pumpfun_task = asyncio.create_task(self.pumpfun_ws.connect_and_subscribe())
+        tasks = [pumpfun_task]
+        
+        # Stream Pump.fun program logs straight from the Solana RPC
+        if self.pumpfun_logs:
+            tasks.append(asyncio.create_task(self.pumpfun_logs.connect_and_subscribe()))
         
-        # Scan other sources every 30 seconds
+        # Scan other sources on an adaptive interval
         async def scan_other_sources():
             while True:
-                try:
-                    await self.dexscreener.scan_new_pairs()
-                    await asyncio.sleep(2)
-                    await self.birdeye.scan_new_tokens()
-                except Exception as e:
-                    logger.error(f"Error in scan loop: {e}")
-                await asyncio.sleep(30)
+                # Each source is a different host, so scan them concurrently
+                results = await asyncio.gather(
+                    self.dexscreener.scan_new_pairs(),
+                    self.birdeye.scan_new_tokens(),
+                    return_exceptions=True
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.error("Error in scan loop: %s", result)
+                
+                # Judge latency on the requests themselves, not on rate-limit pauses
+                latency = max(self.dexscreener.latency or 0, self.birdeye.latency or 0)
+                self.adjust_scan_interval(results, latency)
+                
+                # Honour any Retry-After the APIs sent with a 429, capped like the throttle pauses
+                retry_after = max(self.dexscreener.retry_after or 0, self.birdeye.retry_after or 0)
+                delay = max(self.scan_interval, min(retry_after, self.max_scan_interval))
+                await asyncio.sleep(delay)
         
         scan_task = asyncio.create_task(scan_other_sources())
         
-        # Cleanup
-        async def cleanup_task():
-            while True:
-                await asyncio.sleep(600)
-                if len(self.seen_tokens) > 1000:
-                    logger.info("Cleaning cache...")
-                    self.seen_tokens.clear()
-        
-        cleanup = asyncio.create_task(cleanup_task())
+        # Send queued alerts in batches
+        sender_task = asyncio.create_task(self.alert_sender())
         
-        await asyncio.gather(pumpfun_task, scan_task, cleanup)
+        await asyncio.gather(*tasks, scan_task, sender_task)
 
 
 async def main():
     """Entry point"""
     TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN', 'YOUR_BOT_TOKEN_HERE')
     TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID', 'YOUR_CHAT_ID_HERE')
+    # Opt-in: the logsSubscribe stream sees every Pump.fun transaction, so it needs a dedicated RPC
+    SOLANA_WS_URL = os.getenv('SOLANA_WS_URL')
     
     if TELEGRAM_BOT_TOKEN == 'YOUR_BOT_TOKEN_HERE':
         print("❌ Please set TELEGRAM_BOT_TOKEN")
@@ -763,16 +1225,20 @@ async def main():
         print("❌ Please set TELEGRAM_CHAT_ID")
         return
     
-    scanner = MultiLaunchpadScanner(TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID)
+    scanner = MultiLaunchpadScanner(TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID, rpc_ws_url=SOLANA_WS_URL)
     
     try:
-        await scanner.start()
-        await scanner.run()
+        async with scanner:
+            await scanner.run()
     except KeyboardInterrupt:
         logger.info("Shutting down...")
-    finally:
-        await scanner.stop()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # libuv-backed event loop where available (not on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())